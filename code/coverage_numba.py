@@ -0,0 +1,103 @@
+"""
+coverage_numba.py
+
+Optional Numba-compiled coverage kernels for large Monte Carlo runs.
+
+The NumPy broadcast path in windows_and_coverage.py materialises
+(M, N, K) boolean tensors; these kernels instead loop over the batch
+axis in parallel with a scalar inner loop and no temporaries. They use
+the same closed-interval test lower <= age <= upper, so results are
+identical to the NumPy path.
+
+Numba is not a hard requirement: if it is not installed, HAVE_NUMBA is
+False, the kernels are stubs that raise ImportError, and callers should
+fall back to the NumPy implementation.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA: bool = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def coverage_fixed_windows(ages_batch, lowers, uppers, out):
+        """
+        Coverage for M age sets against one set of K windows.
+
+        ages_batch: (M, N); lowers/uppers: (K,); out: (M,)
+        """
+        M, N = ages_batch.shape
+        K = lowers.shape[0]
+        for m in prange(M):
+            cnt = 0
+            for a in range(N):
+                age = ages_batch[m, a]
+                for k in range(K):
+                    if lowers[k] <= age and age <= uppers[k]:
+                        cnt += 1
+                        break
+            out[m] = cnt / N
+
+    @njit(parallel=True, cache=True)
+    def coverage_fixed_ages(ages, lowers_batch, uppers_batch, out):
+        """
+        Coverage for one set of N ages against M sets of K windows.
+
+        ages: (N,); lowers_batch/uppers_batch: (M, K); out: (M,)
+        """
+        M, K = lowers_batch.shape
+        N = ages.shape[0]
+        for m in prange(M):
+            cnt = 0
+            for a in range(N):
+                age = ages[a]
+                for k in range(K):
+                    if lowers_batch[m, k] <= age and age <= uppers_batch[m, k]:
+                        cnt += 1
+                        break
+            out[m] = cnt / N
+
+else:
+
+    def _numba_unavailable(*args, **kwargs):
+        raise ImportError(
+            "coverage_numba kernels require numba; install it or call the "
+            "Monte Carlo baselines with use_numba=False"
+        )
+
+    coverage_fixed_windows = _numba_unavailable
+    coverage_fixed_ages = _numba_unavailable
+
+
+def limit_threads(n_threads: int) -> None:
+    """
+    Cap the number of threads used by the parallel kernels in this
+    process. No-op without Numba.
+    """
+    if HAVE_NUMBA:
+        from numba import set_num_threads
+        set_num_threads(n_threads)
+
+
+def warmup(dtype=np.float64) -> None:
+    """
+    Trigger JIT compilation on tiny inputs so that compile time is not
+    charged to the first real Monte Carlo call. `dtype` is the dtype of
+    the ages and window bounds the caller will pass; outputs are float64.
+    No-op without Numba.
+    """
+    if not HAVE_NUMBA:
+        return
+    ages = np.zeros(1, dtype=dtype)
+    bounds = np.zeros((1, 1), dtype=dtype)
+    out = np.empty(1, dtype=np.float64)
+    coverage_fixed_windows(bounds, bounds[0], bounds[0], out)
+    coverage_fixed_ages(ages, bounds, bounds, out)
@@ -6,12 +6,14 @@ Compute coverage for linear and exponential baseline spacing models.
 
 from __future__ import annotations
 
+import sys
+
 import numpy as np
 
 from windows_and_coverage import (
-    PhaseWindow,
-    compute_window_half_widths,
-    load_empirical_ages,
+    PhaseWindows,
+    build_windows_from_centres,
+    load_empirical_ages_array,
     coverage_for_ages,
     W0,
     G,
@@ -19,63 +21,43 @@ from windows_and_coverage import (
 )
 
 
-def build_linear_windows() -> list[PhaseWindow]:
+def build_linear_windows() -> PhaseWindows:
     """
     Linear spacing: centres at 10, 25, 40, 55, 70 years.
     t_k = 10 + (k-1) * 15
     """
-    centres = [10 + (k - 1) * 15 for k in range(1, NUM_PHASES + 1)]
-    half_widths = compute_window_half_widths(w0=W0, g=G, K=NUM_PHASES)
-
-    windows = []
-    for idx, (c, h) in enumerate(zip(centres, half_widths), start=1):
-        windows.append(
-            PhaseWindow(
-                index=idx,
-                centre=float(c),
-                lower=float(c - h),
-                upper=float(c + h),
-                half_width=float(h),
-            )
-        )
-    return windows
-
-
-def build_exponential_windows() -> list[PhaseWindow]:
+    return build_windows_from_centres(10.0 + 15.0 * np.arange(NUM_PHASES), w0=W0, g=G)
+
+
+def build_exponential_windows() -> PhaseWindows:
     """
     Exponential spacing: t_k = 10 * r_exp^(k-1)
     where r_exp = (66/10)^(1/4) ≈ 1.60
     """
     r_exp = (66.0 / 10.0) ** 0.25  # ≈ 1.60
-    centres = [10.0 * (r_exp ** (k - 1)) for k in range(1, NUM_PHASES + 1)]
-    half_widths = compute_window_half_widths(w0=W0, g=G, K=NUM_PHASES)
-
-    windows = []
-    for idx, (c, h) in enumerate(zip(centres, half_widths), start=1):
-        windows.append(
-            PhaseWindow(
-                index=idx,
-                centre=float(c),
-                lower=float(c - h),
-                upper=float(c + h),
-                half_width=float(h),
-            )
-        )
-    return windows
+    return build_windows_from_centres(10.0 * r_exp ** np.arange(NUM_PHASES), w0=W0, g=G)
+
+
+def format_windows(windows: PhaseWindows) -> str:
+    """
+    One display line per window, joined into a single string.
+    """
+    return "\n".join(
+        f"  P{w.index}: centre={w.centre:.1f}, window=[{w.lower:.1f}, {w.upper:.1f}]"
+        for w in windows.as_list()
+    )
 
 
 def main():
     """
     Compute coverage for linear and exponential baselines.
     """
-    df = load_empirical_ages()
-    ages = df["age"].to_numpy()
+    ages = load_empirical_ages_array()
 
     # Linear baseline
     print("=== Linear Baseline ===")
     linear_windows = build_linear_windows()
-    for w in linear_windows:
-        print(f"  P{w.index}: centre={w.centre:.1f}, window=[{w.lower:.1f}, {w.upper:.1f}]")
+    sys.stdout.write(format_windows(linear_windows) + "\n")
 
     C_linear, covered_linear, _ = coverage_for_ages(ages, linear_windows)
     print(f"\nLinear coverage: {C_linear:.4f} ({int(C_linear * len(ages))}/16)")
@@ -83,8 +65,7 @@ def main():
     # Exponential baseline
     print("\n=== Exponential Baseline ===")
     exp_windows = build_exponential_windows()
-    for w in exp_windows:
-        print(f"  P{w.index}: centre={w.centre:.1f}, window=[{w.lower:.1f}, {w.upper:.1f}]")
+    sys.stdout.write(format_windows(exp_windows) + "\n")
 
     C_exp, covered_exp, _ = coverage_for_ages(ages, exp_windows)
     print(f"\nExponential coverage: {C_exp:.4f} ({int(C_exp * len(ages))}/16)")
@@ -13,10 +13,14 @@ Monte Carlo baselines for the VFD φ-spaced phase window model:
    - Window centres randomised (and sorted)
 
 Reproducibility: All simulations use fixed seeds for deterministic results.
+Both baselines accept n_workers to split iterations across processes, each
+with its own child stream spawned from the seed via np.random.SeedSequence.
 """
 
 from __future__ import annotations
 
+import multiprocessing as mp
+
 import numpy as np
 
 # ---------------------------------------------------------------------
@@ -24,90 +28,272 @@ import numpy as np
 # ---------------------------------------------------------------------
 GLOBAL_SEED: int = 12345
 
+# Precision of the comparison inputs. Samples are drawn in float64 (so the
+# seeded streams are unchanged) and cast once; at year-scale ages float32
+# gives identical accept/reject decisions for the seeded runs. Coverages
+# themselves are always count / N in float64, so they compare exactly
+# against C_phi from coverage_for_ages for any N.
+MC_DTYPE = np.float32
+
 from windows_and_coverage import (
+    PhaseWindows,
     build_phase_windows,
     compute_window_half_widths,
-    load_empirical_ages,
+    load_empirical_ages_array,
     coverage_for_ages,
     MAX_AGE,
     NUM_PHASES,
     W0,
     G,
-    PhaseWindow,
 )
+from coverage_numba import (
+    HAVE_NUMBA,
+    coverage_fixed_ages,
+    coverage_fixed_windows,
+    limit_threads,
+    warmup as _warmup_kernels,
+)
+
+
+def warmup_numba() -> None:
+    """
+    Compile the Numba kernels for the MC_DTYPE inputs used by both
+    baselines. No-op without Numba.
+    """
+    _warmup_kernels(MC_DTYPE)
+
+
+def _chunked_batch_coverages(
+    ages: np.ndarray,
+    lowers: np.ndarray,
+    uppers: np.ndarray,
+    chunk_size: int,
+) -> np.ndarray:
+    """
+    Blocked equivalent of coverage_for_batches.
+
+    Exactly one of ages (M, N) / lowers, uppers (M, K) carries the batch
+    axis. The batch is processed chunk_size rows at a time through one set
+    of preallocated (chunk, N, K) bool scratch buffers, so no large
+    temporaries are allocated per block. Covered ages are counted with
+    np.count_nonzero rather than a float mean over the bool mask.
+    """
+    batched_ages = ages.ndim == 2
+    M = ages.shape[0] if batched_ages else lowers.shape[0]
+    N = ages.shape[-1]
+    K = lowers.shape[-1]
+
+    coverages = np.empty(M, dtype=np.float64)
+    if M == 0:
+        return coverages
+
+    chunk_size = max(1, min(chunk_size, M))
+    ge_buf = np.empty((chunk_size, N, K), dtype=bool)
+    le_buf = np.empty_like(ge_buf)
+    and_buf = np.empty_like(ge_buf)
+    row_hit = np.empty((chunk_size, N), dtype=bool)
+
+    if batched_ages:
+        ages_view = ages[:, :, None]
+        lowers_view = lowers[None, None, :]
+        uppers_view = uppers[None, None, :]
+    else:
+        ages_view = ages[None, :, None]
+        lowers_view = lowers[:, None, :]
+        uppers_view = uppers[:, None, :]
+
+    for start in range(0, M, chunk_size):
+        stop = min(start + chunk_size, M)
+        m = stop - start
+
+        if batched_ages:
+            a, lo, hi = ages_view[start:stop], lowers_view, uppers_view
+        else:
+            a, lo, hi = ages_view, lowers_view[start:stop], uppers_view[start:stop]
+
+        np.greater_equal(a, lo, out=ge_buf[:m])
+        np.less_equal(a, hi, out=le_buf[:m])
+        np.logical_and(ge_buf[:m], le_buf[:m], out=and_buf[:m])
+        and_buf[:m].any(axis=2, out=row_hit[:m])
+        np.divide(np.count_nonzero(row_hit[:m], axis=1), N, out=coverages[start:stop])
+
+    return coverages
+
+
+def _random_age_coverages(
+    rng: np.random.Generator,
+    n_iter: int,
+    n_ages: int,
+    lowers: np.ndarray,
+    uppers: np.ndarray,
+    chunk_size: int,
+    use_numba: bool,
+) -> np.ndarray:
+    """
+    Coverages for n_iter random-age draws against fixed window bounds.
+    """
+    lowers = lowers.astype(MC_DTYPE)
+    uppers = uppers.astype(MC_DTYPE)
+
+    random_ages = rng.uniform(0.0, MAX_AGE, size=(n_iter, n_ages)).astype(MC_DTYPE)
+    if use_numba:
+        coverages = np.empty(n_iter, dtype=np.float64)
+        coverage_fixed_windows(random_ages, lowers, uppers, coverages)
+        return coverages
+
+    return _chunked_batch_coverages(random_ages, lowers, uppers, chunk_size)
+
+
+def _random_window_coverages(
+    rng: np.random.Generator,
+    n_iter: int,
+    ages: np.ndarray,
+    chunk_size: int,
+    use_numba: bool,
+) -> np.ndarray:
+    """
+    Coverages of fixed ages for n_iter random window placements.
+    """
+    ages = ages.astype(MC_DTYPE)
+    half_widths = compute_window_half_widths(w0=W0, g=G, K=NUM_PHASES)
+
+    # All centres in one bulk draw and one row-wise sort; only the
+    # comparison tensor is blocked. The sort is not optional: half-widths
+    # grow with k, so sorting pairs the narrowest window with the earliest
+    # centre. Unsorted centres pair widths at random and change the null.
+    centres = np.sort(rng.uniform(0.0, MAX_AGE, size=(n_iter, NUM_PHASES)), axis=1)
+    all_lowers = (centres - half_widths).astype(MC_DTYPE)
+    all_uppers = (centres + half_widths).astype(MC_DTYPE)
+
+    if use_numba:
+        coverages = np.empty(n_iter, dtype=np.float64)
+        coverage_fixed_ages(ages, all_lowers, all_uppers, coverages)
+        return coverages
+
+    return _chunked_batch_coverages(ages, all_lowers, all_uppers, chunk_size)
+
+
+def _random_age_worker(args: tuple) -> np.ndarray:
+    seed_seq, n_sub, n_ages, lowers, uppers, chunk_size, use_numba = args
+    rng = np.random.default_rng(seed_seq)
+    return _random_age_coverages(rng, n_sub, n_ages, lowers, uppers, chunk_size, use_numba)
+
+
+def _random_window_worker(args: tuple) -> np.ndarray:
+    seed_seq, n_sub, ages, chunk_size, use_numba = args
+    rng = np.random.default_rng(seed_seq)
+    return _random_window_coverages(rng, n_sub, ages, chunk_size, use_numba)
+
+
+def _init_worker() -> None:
+    # One kernel thread per process: the pool already uses the cores
+    limit_threads(1)
+
+
+def _parallel_coverages(
+    worker,
+    seed: int | np.random.SeedSequence,
+    n_iter: int,
+    n_workers: int,
+    *args,
+) -> np.ndarray:
+    """
+    Split n_iter across n_workers processes, each with an independent
+    child stream from SeedSequence(seed).spawn(n_workers), and concatenate
+    the per-worker coverages in worker order.
+
+    Each worker limits the Numba kernels to a single thread, so the
+    n_workers processes do not oversubscribe to n_workers x ncores threads.
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    children = seed.spawn(n_workers)
+    sizes = [len(part) for part in np.array_split(np.arange(n_iter), n_workers)]
+    tasks = [(child, n_sub) + args for child, n_sub in zip(children, sizes)]
+
+    # "spawn" avoids forking a parent that may already run Numba threads
+    with mp.get_context("spawn").Pool(n_workers, initializer=_init_worker) as pool:
+        parts = pool.map(worker, tasks)
+    return np.concatenate(parts)
+
+
+def _summarise(coverages: np.ndarray) -> dict:
+    return {
+        "mean_coverage": float(coverages.mean()),
+        "std_coverage": float(coverages.std(ddof=1)),
+        "all_coverages": coverages,
+    }
 
 
 def random_age_baseline(
     n_iter: int = 20_000,
     n_ages: int = 16,
-    seed: int = GLOBAL_SEED,
+    seed: int | np.random.SeedSequence = GLOBAL_SEED,
+    chunk_size: int = 4096,
+    use_numba: bool | None = None,
+    n_workers: int = 1,
+    windows: PhaseWindows | None = None,
 ) -> dict:
     """
     Random-age baseline:
     - Ages ~ Uniform(0, MAX_AGE)
-    - Windows = fixed VFD configuration
+    - Windows = fixed VFD configuration (or `windows`, if given)
+
+    Iterations are evaluated in blocks of `chunk_size` to bound memory.
+    use_numba=None selects the compiled kernel when Numba is installed.
+    n_workers > 1 splits the iterations across processes with spawned
+    child seeds; results are then reproducible for a given
+    (seed, n_workers) but differ from the single-stream n_workers=1 run.
+    Each worker process runs the Numba kernels single-threaded, so the
+    parallelism comes from the processes alone.
     """
-    rng = np.random.default_rng(seed)
+    if use_numba is None:
+        use_numba = HAVE_NUMBA
 
-    windows = build_phase_windows()
-    coverages = np.zeros(n_iter, dtype=float)
+    if windows is None:
+        windows = build_phase_windows()
+    args = (n_ages, windows.lowers, windows.uppers, chunk_size, use_numba)
 
-    for i in range(n_iter):
-        random_ages = rng.uniform(0.0, MAX_AGE, size=n_ages)
-        C, _, _ = coverage_for_ages(random_ages, windows)
-        coverages[i] = C
+    if n_workers > 1:
+        coverages = _parallel_coverages(_random_age_worker, seed, n_iter, n_workers, *args)
+    else:
+        rng = np.random.default_rng(seed)
+        coverages = _random_age_coverages(rng, n_iter, *args)
 
-    results = {
-        "mean_coverage": float(coverages.mean()),
-        "std_coverage": float(coverages.std(ddof=1)),
-        "all_coverages": coverages,
-    }
-    return results
+    return _summarise(coverages)
 
 
 def random_window_baseline(
     n_iter: int = 20_000,
-    seed: int = GLOBAL_SEED + 1,  # Use different seed from random_age for independence
+    # Use different seed from random_age for independence
+    seed: int | np.random.SeedSequence = GLOBAL_SEED + 1,
+    chunk_size: int = 4096,
+    use_numba: bool | None = None,
+    n_workers: int = 1,
+    ages: np.ndarray | None = None,
 ) -> dict:
     """
     Random-window baseline:
-    - Ages fixed to empirical set
+    - Ages fixed to empirical set (or `ages`, if given)
     - Window widths fixed to breathing-window widths
     - Window centres randomised uniformly and sorted
+
+    chunk_size, use_numba and n_workers behave as in random_age_baseline.
     """
-    rng = np.random.default_rng(seed)
+    if use_numba is None:
+        use_numba = HAVE_NUMBA
 
-    df = load_empirical_ages()
-    ages = df["age"].to_numpy()
-    n_ages = ages.shape[0]
+    if ages is None:
+        ages = load_empirical_ages_array()
+    args = (ages, chunk_size, use_numba)
 
-    half_widths = compute_window_half_widths(w0=W0, g=G, K=NUM_PHASES)
-    coverages = np.zeros(n_iter, dtype=float)
-
-    for i in range(n_iter):
-        centres = np.sort(rng.uniform(0.0, MAX_AGE, size=NUM_PHASES))
-
-        windows = []
-        for idx, (c, h) in enumerate(zip(centres, half_widths), start=1):
-            windows.append(
-                PhaseWindow(
-                    index=idx,
-                    centre=float(c),
-                    lower=float(c - h),
-                    upper=float(c + h),
-                    half_width=float(h),
-                )
-            )
-
-        C, _, _ = coverage_for_ages(ages, windows)
-        coverages[i] = C
-
-    results = {
-        "mean_coverage": float(coverages.mean()),
-        "std_coverage": float(coverages.std(ddof=1)),
-        "all_coverages": coverages,
-    }
-    return results
+    if n_workers > 1:
+        coverages = _parallel_coverages(_random_window_worker, seed, n_iter, n_workers, *args)
+    else:
+        rng = np.random.default_rng(seed)
+        coverages = _random_window_coverages(rng, n_iter, *args)
+
+    return _summarise(coverages)
 
 
 def main():
@@ -115,11 +301,11 @@ def main():
     Run baselines and print summary statistics and empirical p-values.
     """
     print("=== Monte Carlo Baselines for VFD Phase Windows ===")
+    warmup_numba()
 
     # Compute empirical VFD coverage
     windows = build_phase_windows()
-    df = load_empirical_ages()
-    ages = df["age"].to_numpy()
+    ages = load_empirical_ages_array()
     C_phi, _, _ = coverage_for_ages(ages, windows)
     print(f"Empirical VFD coverage C_phi = {C_phi:.4f}")
 
@@ -15,10 +15,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from windows_and_coverage import (
-    PhaseWindow,
+    PhaseWindows,
+    build_windows_from_centres,
+    compute_phase_centres,
     compute_window_half_widths,
-    load_empirical_ages,
+    load_empirical_ages_array,
     coverage_for_ages,
+    coverage_for_batches,
     build_phase_windows,
     W0,
     G,
@@ -34,39 +37,27 @@ def build_windows_for_ratio(
     w0: float = W0,
     g: float = G,
     K: int = NUM_PHASES,
-) -> list[PhaseWindow]:
+) -> PhaseWindows:
     """
     Build phase windows for an arbitrary scaling ratio r.
 
     t_k = A * r^k
     half-widths w_k = w0 * g^(k-1)
     """
-    k = np.arange(1, K + 1, dtype=float)
-    centres = A * (r ** k)
-    half_widths = compute_window_half_widths(w0=w0, g=g, K=K)
-
-    windows: list[PhaseWindow] = []
-    for idx, (c, h) in enumerate(zip(centres, half_widths), start=1):
-        windows.append(
-            PhaseWindow(
-                index=idx,
-                centre=float(c),
-                lower=float(c - h),
-                upper=float(c + h),
-                half_width=float(h),
-            )
-        )
-    return windows
+    return build_windows_from_centres(compute_phase_centres(A=A, phi=r, K=K), w0=w0, g=g)
 
 
 def scan_ratios(
     r_min: float = 1.4,
     r_max: float = 1.9,
     n_points: int = 51,
+    ages: np.ndarray | None = None,
 ) -> dict:
     """
     Scan scaling ratios r in [r_min, r_max] and compute coverage for each.
 
+    `ages` defaults to the empirical inflection ages.
+
     Returns:
         dict with:
             'ratios' (np.ndarray),
@@ -74,16 +65,17 @@ def scan_ratios(
             'best_r' (float),
             'best_coverage' (float)
     """
-    df = load_empirical_ages()
-    ages = df["age"].to_numpy()
+    if ages is None:
+        ages = load_empirical_ages_array()
 
     ratios = np.linspace(r_min, r_max, n_points)
-    coverages = np.zeros_like(ratios)
 
-    for i, r in enumerate(ratios):
-        windows = build_windows_for_ratio(r)
-        C, _, _ = coverage_for_ages(ages, windows)
-        coverages[i] = C
+    # All ratios at once: centres/lowers/uppers are (n_r, K) and the hit
+    # tensor is (n_r, N, K), a few KB of bools at the default scan size.
+    half_widths = compute_window_half_widths(w0=W0, g=G, K=NUM_PHASES)
+    powers = np.broadcast_to(ratios[:, None], (ratios.shape[0], NUM_PHASES))
+    centres = ANCHOR_A * np.cumprod(powers, axis=1)
+    coverages = coverage_for_batches(ages, centres - half_widths, centres + half_widths)
 
     best_idx = int(np.argmax(coverages))
     best_r = float(ratios[best_idx])
@@ -122,8 +114,7 @@ def main():
     """
     Run ratio scan and print key summary values.
     """
-    df = load_empirical_ages()
-    ages = df["age"].to_numpy()
+    ages = load_empirical_ages_array()
 
     # Baseline φ coverage
     windows_phi = build_phase_windows()
@@ -13,11 +13,17 @@ This module is designed to reproduce the main numerical results in:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple, Sequence, Dict
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Tuple, Sequence, Dict, Union
 
-import numpy as np
-import pandas as pd
+import csv
 import pathlib
+import sys
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # ---------------------------------------------------------------------
@@ -51,6 +57,56 @@ class PhaseWindow:
         return self.lower <= age <= self.upper
 
 
+@dataclass(frozen=True, eq=False)
+class PhaseWindows:
+    """
+    Structure-of-arrays container for K phase windows.
+
+    Window k (1-based) is [lowers[k-1], uppers[k-1]] around centres[k-1].
+    """
+    centres: np.ndarray  # years, shape (K,)
+    lowers: np.ndarray   # years, shape (K,)
+    uppers: np.ndarray   # years, shape (K,)
+
+    @property
+    def half_widths(self) -> np.ndarray:
+        return self.centres - self.lowers
+
+    def contains(self, ages: Sequence[float]) -> np.ndarray:
+        """
+        Boolean mask over ages: True where the age lies in any window.
+        """
+        ages_arr = np.asarray(ages, dtype=float)
+        return _window_hits(ages_arr, self.lowers, self.uppers).any(axis=1)
+
+    def as_list(self) -> List[PhaseWindow]:
+        """
+        Expand into PhaseWindow objects (for display only).
+        """
+        return [
+            PhaseWindow(
+                index=idx,
+                centre=float(c),
+                lower=float(lo),
+                upper=float(hi),
+                half_width=float(h),
+            )
+            for idx, (c, lo, hi, h) in enumerate(
+                zip(self.centres, self.lowers, self.uppers, self.half_widths),
+                start=1,
+            )
+        ]
+
+    def __len__(self) -> int:
+        return self.centres.shape[0]
+
+    def __iter__(self):
+        return iter(self.as_list())
+
+
+WindowsLike = Union[PhaseWindows, Sequence[PhaseWindow], Tuple[np.ndarray, np.ndarray]]
+
+
 # ---------------------------------------------------------------------
 # Core VFD timing model
 # ---------------------------------------------------------------------
@@ -62,9 +118,10 @@ def compute_phase_centres(
 ) -> np.ndarray:
     """
     Compute phase centres t_k = A * phi^k for k=1..K.
+
+    The powers are built by cumulative multiplication rather than pow.
     """
-    k = np.arange(1, K + 1, dtype=float)
-    centres = A * (phi ** k)
+    centres = A * np.cumprod(np.full(K, phi, dtype=np.float64))
     return centres
 
 
@@ -76,42 +133,110 @@ def compute_window_half_widths(
     """
     Compute breathing-window half-widths w_k = w0 * g^(k-1) for k=1..K.
     """
-    k = np.arange(0, K, dtype=float)
-    widths = w0 * (g ** k)
+    factors = np.concatenate(([1.0], np.full(max(K - 1, 0), g, dtype=np.float64)))
+    widths = w0 * np.cumprod(factors)[:K]
     return widths
 
 
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    arr.flags.writeable = False
+    return arr
+
+
+def build_windows_from_centres(
+    centres: Sequence[float] | np.ndarray,
+    w0: float = W0,
+    g: float = G
+) -> PhaseWindows:
+    """
+    Shared builder: breathing windows w_k = w0 * g^(k-1) around the given
+    centres. The returned arrays are read-only.
+    """
+    centres = np.asarray(centres, dtype=np.float64)
+    half_widths = compute_window_half_widths(w0=w0, g=g, K=centres.shape[0])
+    return PhaseWindows(
+        centres=_readonly(centres.copy()),
+        lowers=_readonly(centres - half_widths),
+        uppers=_readonly(centres + half_widths),
+    )
+
+
+@lru_cache(maxsize=None)
 def build_phase_windows(
     A: float = ANCHOR_A,
     phi: float = PHI,
     w0: float = W0,
     g: float = G,
     K: int = NUM_PHASES
-) -> List[PhaseWindow]:
+) -> PhaseWindows:
     """
-    Construct PhaseWindow objects for the specified parameters.
+    Construct the phase windows for the specified parameters.
+
+    Results are cached per parameter set and shared between callers.
+    The default φ configuration wraps the precomputed module-level arrays.
     """
-    centres = compute_phase_centres(A=A, phi=phi, K=K)
-    half_widths = compute_window_half_widths(w0=w0, g=g, K=K)
+    if (A, phi, w0, g, K) == (ANCHOR_A, PHI, W0, G, NUM_PHASES):
+        return PhaseWindows(centres=_CENTRES_PHI, lowers=_LOWERS_PHI, uppers=_UPPERS_PHI)
+    return build_windows_from_centres(compute_phase_centres(A=A, phi=phi, K=K), w0=w0, g=g)
 
-    windows: List[PhaseWindow] = []
-    for idx, (c, h) in enumerate(zip(centres, half_widths), start=1):
-        windows.append(
-            PhaseWindow(
-                index=idx,
-                centre=float(c),
-                lower=float(c - h),
-                upper=float(c + h),
-                half_width=float(h),
-            )
-        )
-    return windows
+
+# Default φ configuration, evaluated once at import time
+_CENTRES_PHI = _readonly(compute_phase_centres())
+_HALF_WIDTHS = _readonly(compute_window_half_widths())
+_LOWERS_PHI = _readonly(_CENTRES_PHI - _HALF_WIDTHS)
+_UPPERS_PHI = _readonly(_CENTRES_PHI + _HALF_WIDTHS)
 
 
 # ---------------------------------------------------------------------
 # Empirical ages and coverage
 # ---------------------------------------------------------------------
 
+def _read_age_rows(
+    csv_path: pathlib.Path | None = None
+) -> List[Tuple[str, float]]:
+    """
+    Read (dataset, age) rows from the empirical ages CSV with the stdlib
+    csv module, skipping the header.
+    """
+    path = csv_path or DATA_PATH_DEFAULT
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        next(reader)
+        rows = [(ds, float(age)) for ds, age in reader]
+    return rows
+
+
+def _resolve_data_path(csv_path: pathlib.Path | None) -> str:
+    return str(pathlib.Path(csv_path or DATA_PATH_DEFAULT).resolve())
+
+
+@lru_cache(maxsize=None)
+def _load_cached_ages_array(path_str: str) -> np.ndarray:
+    rows = _read_age_rows(pathlib.Path(path_str))
+    ages = np.fromiter((age for _, age in rows), dtype=np.float64, count=len(rows))
+    return _readonly(ages)
+
+
+@lru_cache(maxsize=None)
+def _load_cached(path_str: str) -> pd.DataFrame:
+    import pandas as pd
+
+    rows = _read_age_rows(pathlib.Path(path_str))
+    return pd.DataFrame(rows, columns=["dataset", "age"])
+
+
+def load_empirical_ages_array(
+    csv_path: pathlib.Path | None = None
+) -> np.ndarray:
+    """
+    Load empirical inflection ages as a float array, without pandas.
+
+    The file is parsed once per resolved path; the cached array is shared
+    between callers and is therefore read-only.
+    """
+    return _load_cached_ages_array(_resolve_data_path(csv_path))
+
+
 def load_empirical_ages(
     csv_path: pathlib.Path | None = None
 ) -> pd.DataFrame:
@@ -125,45 +250,156 @@ def load_empirical_ages(
 
     Returns:
         DataFrame with columns: ['dataset', 'age']
+
+    The file is parsed once per resolved path and each call returns a
+    copy of the cached frame. Numeric callers that only need the ages
+    should prefer load_empirical_ages_array(), which avoids pandas.
     """
-    path = csv_path or DATA_PATH_DEFAULT
-    df = pd.read_csv(path)
-    df["age"] = df["age"].astype(float)
-    return df
+    return _load_cached(_resolve_data_path(csv_path)).copy()
+
+
+def _window_bounds(
+    windows: WindowsLike
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return (lowers, uppers, indices) arrays of shape (K,) for a PhaseWindows
+    container, a sequence of PhaseWindow objects, or a precomputed
+    (lowers, uppers) pair.
+    """
+    if isinstance(windows, PhaseWindows):
+        indices = np.arange(1, len(windows) + 1)
+        return windows.lowers, windows.uppers, indices
+
+    if isinstance(windows, tuple) and len(windows) == 2 \
+            and not isinstance(windows[0], PhaseWindow):
+        lowers = np.asarray(windows[0], dtype=np.float64)
+        uppers = np.asarray(windows[1], dtype=np.float64)
+        indices = np.arange(1, lowers.shape[0] + 1)
+        return lowers, uppers, indices
+
+    K = len(windows)
+    lowers = np.fromiter((w.lower for w in windows), dtype=np.float64, count=K)
+    uppers = np.fromiter((w.upper for w in windows), dtype=np.float64, count=K)
+    indices = np.fromiter((w.index for w in windows), dtype=np.int64, count=K)
+    return lowers, uppers, indices
+
+
+def _window_hits(
+    ages: np.ndarray,
+    lowers: np.ndarray,
+    uppers: np.ndarray
+) -> np.ndarray:
+    """
+    Boolean (N, K) matrix: hits[i, k] is True if ages[i] lies in window k.
+    """
+    return (ages[:, None] >= lowers[None, :]) & (ages[:, None] <= uppers[None, :])
+
+
+def coverage_for_ages_arrays(
+    ages: np.ndarray,
+    lowers: np.ndarray,
+    uppers: np.ndarray
+) -> float:
+    """
+    Fast path for coverage C when window bounds are already arrays.
+
+    Returns only the scalar coverage; no window assignment is computed.
+    """
+    N = ages.shape[0]
+    if N == 0:
+        return 0.0
+    return np.count_nonzero(_window_hits(ages, lowers, uppers).any(axis=1)) / N
+
+
+def coverage_searchsorted(
+    ages: np.ndarray,
+    lowers: np.ndarray,
+    uppers: np.ndarray
+) -> float:
+    """
+    Coverage C via binary search over window lower bounds.
+
+    For windows ordered by centre with non-decreasing lowers and uppers
+    (as for all geometric models here, overlapping or not), the window
+    with the largest lower bound <= age also has the largest upper bound
+    among candidates, so one searchsorted per age decides coverage in
+    O(log K). Other configurations fall back to the broadcast path.
+    """
+    ages = np.asarray(ages, dtype=float)
+    lowers = np.asarray(lowers, dtype=float)
+    uppers = np.asarray(uppers, dtype=float)
+
+    if ages.shape[0] == 0 or lowers.shape[0] == 0:
+        return 0.0
+    if np.any(np.diff(lowers) < 0) or np.any(np.diff(uppers) < 0):
+        return coverage_for_ages_arrays(ages, lowers, uppers)
+
+    idx = np.searchsorted(lowers, ages, side="right") - 1
+    covered = (idx >= 0) & (ages <= uppers[np.clip(idx, 0, None)])
+    return np.count_nonzero(covered) / ages.shape[0]
+
+
+def coverage_for_batches(
+    ages: np.ndarray,
+    lowers: np.ndarray,
+    uppers: np.ndarray
+) -> np.ndarray:
+    """
+    Coverage for a batch of M independent (ages, windows) configurations.
+
+    Either argument may carry the leading batch axis:
+        ages:           (M, N) or (N,)
+        lowers/uppers:  (M, K) or (K,)
+
+    The (M, N, K) hit tensor is evaluated in one broadcast and reduced
+    to an (M,) array of coverages.
+    """
+    ages = np.asarray(ages, dtype=float)
+    lowers = np.asarray(lowers, dtype=float)
+    uppers = np.asarray(uppers, dtype=float)
+
+    a = ages[..., :, None]
+    hits = (a >= lowers[..., None, :]) & (a <= uppers[..., None, :])
+    return np.count_nonzero(hits.any(axis=-1), axis=-1) / ages.shape[-1]
 
 
 def coverage_for_ages(
     ages: Sequence[float],
-    windows: Sequence[PhaseWindow]
-) -> Tuple[float, np.ndarray, List[int | None]]:
+    windows: WindowsLike
+) -> Tuple[float, np.ndarray, np.ndarray]:
     """
     Compute coverage C = (# ages inside any window) / N.
 
+    `windows` may be a PhaseWindows container, a sequence of PhaseWindow
+    objects or a precomputed (lowers, uppers) pair of arrays. All ages are
+    tested against all windows in a single broadcast (N, K) comparison.
+
     Returns:
         coverage (float),
         covered_mask (bool array),
-        assigned_windows (list of phase indices or None)
+        assigned_windows (int8 array of phase indices, -1 if not covered)
     """
     ages_arr = np.asarray(ages, dtype=float)
     N = ages_arr.shape[0]
+    lowers, uppers, indices = _window_bounds(windows)
 
-    covered_mask = np.zeros(N, dtype=bool)
-    assigned_windows: List[int | None] = [None] * N
+    hits = _window_hits(ages_arr, lowers, uppers)
+    covered_mask = hits.any(axis=1)
 
-    for i, age in enumerate(ages_arr):
-        for w in windows:
-            if w.contains(age):
-                covered_mask[i] = True
-                assigned_windows[i] = w.index
-                break  # first matching window is fine
+    # argmax picks the first matching window, as in PhaseWindow.contains order
+    if lowers.shape[0] > 0:
+        assigned_windows = np.where(covered_mask, indices[hits.argmax(axis=1)], -1)
+    else:
+        assigned_windows = np.full(N, -1)
+    assigned_windows = assigned_windows.astype(np.int8)
 
-    coverage = covered_mask.mean() if N > 0 else 0.0
+    coverage = np.count_nonzero(covered_mask) / N if N > 0 else 0.0
     return coverage, covered_mask, assigned_windows
 
 
 def summarise_coverage_table(
     df: pd.DataFrame,
-    windows: Sequence[PhaseWindow]
+    windows: WindowsLike
 ) -> pd.DataFrame:
     """
     Produce a table similar to Table 4 in the paper, assigning each age to a window.
@@ -172,7 +408,8 @@ def summarise_coverage_table(
     coverage, covered_mask, assigned_windows = coverage_for_ages(ages, windows)
 
     df_out = df.copy()
-    df_out["phase"] = assigned_windows
+    # Uncovered ages are shown as missing (NaN) in the display table
+    df_out["phase"] = np.where(assigned_windows == -1, np.nan, assigned_windows)
     df_out["covered"] = covered_mask
     df_out["coverage_fraction"] = coverage
 
@@ -191,12 +428,12 @@ def main():
     """
     print("=== VFD φ-Spaced Phase Windows ===")
     windows = build_phase_windows()
-    for w in windows:
-        print(
-            f"P{w.index}: centre={w.centre:.2f} years, "
-            f"window=[{w.lower:.1f}, {w.upper:.1f}], "
-            f"half-width={w.half_width:.2f}"
-        )
+    sys.stdout.write("\n".join(
+        f"P{w.index}: centre={w.centre:.2f} years, "
+        f"window=[{w.lower:.1f}, {w.upper:.1f}], "
+        f"half-width={w.half_width:.2f}"
+        for w in windows.as_list()
+    ) + "\n")
 
     print("\n=== Empirical inflection age coverage ===")
     df = load_empirical_ages()